@@ -1,16 +1,25 @@
 """FreshRSS Google Reader API client."""
 
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from types import TracebackType
-from urllib.parse import quote, urlencode
+from typing import Any
+from urllib.parse import quote
 
 import httpx
+import ijson
+import orjson
+from pydantic import BaseModel, TypeAdapter
 
 from freshrss_mcp_server.api.models import (
     Article,
     StreamContents,
     Subscription,
     SubscriptionList,
+    SubscriptionResponse,
     UnreadCountResponse,
 )
 from freshrss_mcp_server.exceptions import APIError, AuthenticationError
@@ -22,6 +31,29 @@ STATE_READ = "user/-/state/com.google/read"
 STATE_STARRED = "user/-/state/com.google/starred"
 STATE_READING_LIST = "user/-/state/com.google/reading-list"
 
+# Every request goes to the same FreshRSS host, so keep connections warm.
+# nginx (FreshRSS' usual front end) holds idle keep-alive connections for 75s.
+HTTP_KEEPALIVE_EXPIRY = 75.0  # seconds
+
+# Action tokens expire server-side; reuse one only for a short window
+ACTION_TOKEN_TTL = 300.0  # seconds
+
+# Maximum article IDs per edit-tag request; larger lists are sent in parallel chunks
+EDIT_TAG_BATCH_SIZE = 500
+
+# Validates a whole page of stream items in a single pydantic-core call
+ARTICLE_LIST_ADAPTER = TypeAdapter(list[Article])
+
+
+@lru_cache(maxsize=256)
+def _quote_stream_id(stream_id: str) -> str:
+    """Percent-encode a stream ID or tag for use in a URL.
+
+    Stream IDs are feed IDs, categories and state tags, a small bounded set
+    that is re-encoded on every page and every edit-tag call.
+    """
+    return quote(stream_id, safe="")
+
 
 class FreshRSSClient:
     """Async client for FreshRSS Google Reader API."""
@@ -32,6 +64,9 @@ class FreshRSSClient:
         username: str,
         password: str,
         timeout: int = 30,
+        subscriptions_cache_ttl: float = 60.0,
+        unread_counts_cache_ttl: float = 5.0,
+        max_connections: int = 50,
     ) -> None:
         """Initialize the FreshRSS client.
 
@@ -40,18 +75,39 @@ class FreshRSSClient:
             username: FreshRSS username
             password: FreshRSS API password
             timeout: Request timeout in seconds
+            subscriptions_cache_ttl: Seconds to reuse the subscription list (0 disables)
+            unread_counts_cache_ttl: Seconds to reuse unread counts (0 disables)
+            max_connections: Size of the shared connection pool to FreshRSS
         """
         self.api_url = api_url.rstrip("/")
         self.username = username
         self.password = password
         self.timeout = timeout
+        self.subscriptions_cache_ttl = subscriptions_cache_ttl
+        self.unread_counts_cache_ttl = unread_counts_cache_ttl
+        self.max_connections = max_connections
         self._auth_token: str | None = None
         self._action_token: str | None = None
+        self._action_token_expires: float = 0.0
         self._client: httpx.AsyncClient | None = None
+        # Default headers for every request; Authorization is added once authenticated
+        self._headers: dict[str, str] = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            # JSON stream pages compress well; httpx decodes both transparently
+            "Accept-Encoding": "gzip, br",
+        }
+        # URL -> (ETag, Last-Modified, parsed response) for conditional GETs
+        self._etag_cache: dict[str, tuple[str | None, str | None, BaseModel]] = {}
+        # URL -> (monotonic fetch time, parsed response) for TTL caching
+        self._cache: dict[str, tuple[float, BaseModel]] = {}
+        # URL -> in-flight fetch shared by concurrent callers (single-flight)
+        self._inflight: dict[str, asyncio.Task[BaseModel]] = {}
+        # Bumped by invalidate(); fetches that span a bump don't write the caches
+        self._cache_generation = 0
 
     async def __aenter__(self) -> FreshRSSClient:
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._get_client()
         return self
 
     async def __aexit__(
@@ -65,10 +121,28 @@ class FreshRSSClient:
             await self._client.aclose()
             self._client = None
 
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP/2 client shared by all API calls."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            # Concurrent tool calls fan out over the pool; idle connections stay warm
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            headers=self._headers,
+        )
+
     def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client, creating if needed."""
+        """Get HTTP client, creating if needed.
+
+        Synchronous on purpose: with no await between the check and the
+        assignment, concurrent tasks always share a single client.
+        """
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = self._create_http_client()
         return self._client
 
     # =========================================================================
@@ -101,17 +175,20 @@ class FreshRSSClient:
         except httpx.RequestError as e:
             raise AuthenticationError(f"Authentication request failed: {e}") from e
 
-        # Parse response: SID=xxx\nLSID=xxx\nAuth=xxx
-        auth_data: dict[str, str] = {}
-        for line in response.text.strip().split("\n"):
-            if "=" in line:
-                key, value = line.split("=", 1)
-                auth_data[key] = value
-
-        if "Auth" not in auth_data:
+        # Parse response: SID=xxx\nLSID=xxx\nAuth=xxx (only Auth is needed)
+        for line in response.text.strip().splitlines():
+            key, sep, value = line.partition("=")
+            if sep and key == "Auth":
+                self._auth_token = value
+                break
+        else:
             raise AuthenticationError("Auth token not found in response")
 
-        self._auth_token = auth_data["Auth"]
+        # Attach to the client defaults so individual requests don't build headers
+        self._headers["Authorization"] = f"GoogleLogin auth={self._auth_token}"
+        if self._client is not None:
+            self._client.headers["Authorization"] = self._headers["Authorization"]
+
         logger.info("Successfully authenticated with FreshRSS")
         return self._auth_token
 
@@ -120,13 +197,6 @@ class FreshRSSClient:
         if self._auth_token is None:
             await self.authenticate()
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers with authorization."""
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        if self._auth_token:
-            headers["Authorization"] = f"GoogleLogin auth={self._auth_token}"
-        return headers
-
     async def get_token(self) -> str:
         """Get action token for POST operations.
 
@@ -141,7 +211,7 @@ class FreshRSSClient:
         url = f"{self.api_url}/reader/api/0/token"
 
         try:
-            response = await client.get(url, headers=self._get_headers())
+            response = await client.get(url)
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise APIError(
@@ -149,19 +219,24 @@ class FreshRSSClient:
             ) from e
 
         self._action_token = response.text.strip()
+        self._action_token_expires = time.monotonic() + ACTION_TOKEN_TTL
         return self._action_token
 
     async def _ensure_action_token(self) -> str:
         """Ensure action token is available and fresh.
 
-        Note: Always fetch a new token because FreshRSS action tokens expire.
-        The token expiration time is relatively short, and caching can lead to
-        'Invalid POST token' errors in long-running sessions.
+        Note: FreshRSS action tokens expire, so a cached token is only reused
+        for ACTION_TOKEN_TTL seconds. If the server still rejects it, callers
+        invalidate it with _invalidate_action_token and retry once.
         """
-        # Always get a fresh token to avoid expiration issues
-        await self.get_token()
+        if self._action_token is None or time.monotonic() >= self._action_token_expires:
+            await self.get_token()
         return self._action_token  # type: ignore[return-value]
 
+    def _invalidate_action_token(self) -> None:
+        """Force the next _ensure_action_token call to fetch a new token."""
+        self._action_token_expires = 0.0
+
     # =========================================================================
     # Subscriptions
     # =========================================================================
@@ -175,25 +250,10 @@ class FreshRSSClient:
         Raises:
             APIError: If request fails.
         """
-        await self._ensure_authenticated()
-        client = self._get_client()
         url = f"{self.api_url}/reader/api/0/subscription/list"
-
-        try:
-            response = await client.get(
-                url,
-                params={"output": "json"},
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise APIError(
-                f"Failed to get subscriptions: {e.response.status_code}",
-                e.response.status_code,
-            ) from e
-
-        data = response.json()
-        subscription_list = SubscriptionList.model_validate(data)
+        subscription_list = await self._cached_get(
+            url, SubscriptionList, "Failed to get subscriptions", self.subscriptions_cache_ttl
+        )
         return subscription_list.subscriptions
 
     async def get_unread_counts(self) -> dict[str, int]:
@@ -205,39 +265,156 @@ class FreshRSSClient:
         Raises:
             APIError: If request fails.
         """
+        url = f"{self.api_url}/reader/api/0/unread-count"
+        unread_response = await self._cached_get(
+            url, UnreadCountResponse, "Failed to get unread counts", self.unread_counts_cache_ttl
+        )
+        return {item.id: item.count for item in unread_response.unreadcounts}
+
+    async def get_subscriptions_with_unread(self) -> list[SubscriptionResponse]:
+        """Get all subscriptions joined with their unread counts.
+
+        Both endpoints are requested concurrently.
+
+        Returns:
+            List of SubscriptionResponse objects.
+
+        Raises:
+            APIError: If either request fails.
+        """
+        # Authenticate up front so the concurrent requests don't both log in
+        await self._ensure_authenticated()
+        subscriptions, unread_counts = await asyncio.gather(
+            self.get_subscriptions(), self.get_unread_counts()
+        )
+        return [
+            SubscriptionResponse.from_subscription(sub, unread_count=unread_counts.get(sub.id, 0))
+            for sub in subscriptions
+        ]
+
+    async def _cached_get[ModelT: BaseModel](
+        self,
+        url: str,
+        model_cls: type[ModelT],
+        error_message: str,
+        ttl: float = 0.0,
+    ) -> ModelT:
+        """GET a JSON endpoint, with TTL caching and ETag/Last-Modified revalidation.
+
+        Args:
+            url: Endpoint URL (requested with output=json)
+            model_cls: Model to parse the response into
+            error_message: Prefix for the APIError raised on failure
+            ttl: Seconds a response is reused without contacting the server
+
+        Returns:
+            Parsed response, or the cached one if it is still fresh or the
+            server answers 304.
+
+        Raises:
+            APIError: If request fails.
+        """
+        fresh = self._cache.get(url)
+        if fresh and time.monotonic() - fresh[0] < ttl:
+            return fresh[1]  # type: ignore[return-value]
+
+        # Concurrent misses for the same URL share one request
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache(url, model_cls, error_message))
+            self._inflight[url] = task
+            task.add_done_callback(lambda done: self._discard_inflight(url, done))
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)  # type: ignore[return-value]
+
+    async def _fetch_and_cache[ModelT: BaseModel](
+        self,
+        url: str,
+        model_cls: type[ModelT],
+        error_message: str,
+    ) -> ModelT:
+        """Conditionally GET a JSON endpoint and store the result in both caches.
+
+        If invalidate() is called while the request is in flight, the result is
+        still returned to the callers that were waiting for it, but it is not
+        cached, since it may predate the change.
+
+        Raises:
+            APIError: If request fails.
+        """
+        generation = self._cache_generation
         await self._ensure_authenticated()
         client = self._get_client()
-        url = f"{self.api_url}/reader/api/0/unread-count"
+
+        headers: dict[str, str] = {}
+        cached = self._etag_cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         try:
             response = await client.get(
                 url,
                 params={"output": "json"},
-                headers=self._get_headers(),
+                headers=headers,
             )
+            if cached and response.status_code == 304:
+                if generation == self._cache_generation:
+                    self._cache[url] = (time.monotonic(), cached[2])
+                return cached[2]  # type: ignore[return-value]
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise APIError(
-                f"Failed to get unread counts: {e.response.status_code}",
+                f"{error_message}: {e.response.status_code}",
                 e.response.status_code,
             ) from e
 
-        data = response.json()
-        unread_response = UnreadCountResponse.model_validate(data)
-        return {item.id: item.count for item in unread_response.unreadcounts}
+        result = model_cls.model_validate_json(response.content)
+        if generation != self._cache_generation:
+            return result
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._etag_cache[url] = (etag, last_modified, result)
+        self._cache[url] = (time.monotonic(), result)
+        return result
+
+    def _discard_inflight(self, url: str, task: asyncio.Task[BaseModel]) -> None:
+        """Forget a finished single-flight fetch."""
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every waiter was cancelled
+            task.exception()
+
+    def invalidate(self) -> None:
+        """Drop TTL-cached responses so the next call asks FreshRSS again.
+
+        Called after state changes (e.g., mark as read) so unread counts refresh.
+        ETag validators are kept, so the next request can still be a cheap 304.
+        In-flight fetches are detached so later callers don't join a request
+        that started before the change, and their results are not cached.
+        """
+        self._cache_generation += 1
+        self._cache.clear()
+        self._inflight.clear()
 
     # =========================================================================
     # Articles
     # =========================================================================
 
-    async def get_stream_contents(
+    async def _request_stream_contents(
         self,
         stream_id: str,
-        count: int = 100,
+        count: int,
         continuation: str | None = None,
         exclude_target: str | None = None,
-    ) -> StreamContents:
-        """Get contents of a stream (feed, category, or state).
+    ) -> httpx.Response:
+        """Request one page of a stream.
 
         Args:
             stream_id: Stream identifier (feed ID, category, or state tag)
@@ -246,7 +423,7 @@ class FreshRSSClient:
             exclude_target: State tag to exclude (e.g., read articles)
 
         Returns:
-            StreamContents with articles.
+            Successful stream/contents HTTP response.
 
         Raises:
             APIError: If request fails.
@@ -255,7 +432,7 @@ class FreshRSSClient:
         client = self._get_client()
 
         # URL encode the stream_id
-        encoded_stream_id = quote(stream_id, safe="")
+        encoded_stream_id = _quote_stream_id(stream_id)
         url = f"{self.api_url}/reader/api/0/stream/contents/{encoded_stream_id}"
 
         params: dict[str, str | int] = {
@@ -271,7 +448,6 @@ class FreshRSSClient:
             response = await client.get(
                 url,
                 params=params,
-                headers=self._get_headers(),
             )
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -280,51 +456,138 @@ class FreshRSSClient:
                 e.response.status_code,
             ) from e
 
-        data = response.json()
-        return StreamContents.model_validate(data)
+        return response
 
-    async def get_unread_articles(
+    async def _get_stream_items_raw(
+        self,
+        stream_id: str,
+        count: int,
+        continuation: str | None = None,
+        exclude_target: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Fetch one page of a stream as raw item dicts and its continuation token.
+
+        Used by the unread pager, which needs the continuation token before
+        the items are validated and never reads the stream's id/title/updated.
+
+        Returns:
+            Tuple of (raw item dicts, continuation token or None).
+
+        Raises:
+            APIError: If request fails.
+        """
+        response = await self._request_stream_contents(
+            stream_id, count, continuation, exclude_target
+        )
+        data = orjson.loads(response.content)
+        return data.get("items", []), data.get("continuation")
+
+    async def get_stream_contents(
+        self,
+        stream_id: str,
+        count: int = 100,
+        continuation: str | None = None,
+        exclude_target: str | None = None,
+    ) -> StreamContents:
+        """Get contents of a stream (feed, category, or state).
+
+        Args:
+            stream_id: Stream identifier (feed ID, category, or state tag)
+            count: Maximum number of items to return
+            continuation: Continuation token for pagination
+            exclude_target: State tag to exclude (e.g., read articles)
+
+        Returns:
+            StreamContents with articles.
+
+        Raises:
+            APIError: If request fails.
+        """
+        response = await self._request_stream_contents(
+            stream_id=stream_id,
+            count=count,
+            continuation=continuation,
+            exclude_target=exclude_target,
+        )
+        return StreamContents.model_validate_json(response.content)
+
+    async def iter_unread_articles(
         self,
         limit: int = 100,
         feed_id: str | None = None,
-    ) -> list[Article]:
-        """Get unread articles.
+    ) -> AsyncIterator[Article]:
+        """Iterate over unread articles, prefetching the next page.
+
+        The request for page N+1 is issued as soon as page N's continuation
+        token is known, so validating page N overlaps with the next round trip.
 
         Args:
-            limit: Maximum number of articles to return
+            limit: Maximum number of articles to yield
             feed_id: Optional feed ID to filter by
 
-        Returns:
-            List of unread Article objects.
+        Yields:
+            Unread Article objects, in stream order.
 
         Raises:
             APIError: If request fails.
         """
         stream_id = feed_id if feed_id else STATE_READING_LIST
-        exclude = STATE_READ
+        fetched = 0
+        yielded = 0
+        batch_size = min(limit, 100)  # API typically limits to 100 per request
+        next_page: asyncio.Task[tuple[list[dict[str, Any]], str | None]] | None = None
 
-        articles: list[Article] = []
-        continuation: str | None = None
+        if limit <= 0:
+            return
 
-        while len(articles) < limit:
-            remaining = limit - len(articles)
-            batch_size = min(remaining, 100)  # API typically limits to 100 per request
-
-            stream = await self.get_stream_contents(
-                stream_id=stream_id,
-                count=batch_size,
-                continuation=continuation,
-                exclude_target=exclude,
+        try:
+            next_page = asyncio.create_task(
+                self._get_stream_items_raw(stream_id, batch_size, exclude_target=STATE_READ)
             )
+            while next_page is not None:
+                items, continuation = await next_page
+                next_page = None
+                fetched += len(items)
+
+                if continuation and len(items) >= batch_size and fetched < limit:
+                    batch_size = min(limit - fetched, 100)
+                    next_page = asyncio.create_task(
+                        self._get_stream_items_raw(
+                            stream_id,
+                            batch_size,
+                            continuation=continuation,
+                            exclude_target=STATE_READ,
+                        )
+                    )
+                    # Let the prefetch task send its request before validating this page
+                    await asyncio.sleep(0)
+
+                # Only validate what the caller can still receive
+                for article in ARTICLE_LIST_ADAPTER.validate_python(items[: limit - yielded]):
+                    yield article
+                yielded += min(len(items), limit - yielded)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
-            articles.extend(stream.items)
+    async def get_unread_articles(
+        self,
+        limit: int = 100,
+        feed_id: str | None = None,
+    ) -> list[Article]:
+        """Get unread articles.
 
-            if not stream.continuation or len(stream.items) < batch_size:
-                break
+        Args:
+            limit: Maximum number of articles to return
+            feed_id: Optional feed ID to filter by
 
-            continuation = stream.continuation
+        Returns:
+            List of unread Article objects.
 
-        return articles[:limit]
+        Raises:
+            APIError: If request fails.
+        """
+        return [article async for article in self.iter_unread_articles(limit, feed_id)]
 
     async def get_article_ids(
         self,
@@ -357,22 +620,65 @@ class FreshRSSClient:
         if exclude_target:
             params["xt"] = exclude_target
 
+        # Response format: {"itemRefs": [{"id": "..."}, ...]}
+        # Parse incrementally so only the ID strings are kept, not every itemRef dict
+        article_ids: list[str] = ijson.sendable_list()
+        parser = ijson.items_coro(article_ids, "itemRefs.item.id")
+
         try:
-            response = await client.get(
+            async with client.stream(
+                "GET",
                 url,
                 params=params,
-                headers=self._get_headers(),
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+        except httpx.HTTPStatusError as e:
+            raise APIError(
+                f"Failed to get article IDs: {e.response.status_code}",
+                e.response.status_code,
+            ) from e
+
+        parser.close()
+        return article_ids
+
+    async def get_items_contents(self, article_ids: list[str]) -> list[Article]:
+        """Get specific articles by ID.
+
+        Args:
+            article_ids: List of article IDs to fetch
+
+        Returns:
+            List of Article objects for the IDs that exist.
+
+        Raises:
+            APIError: If request fails.
+        """
+        if not article_ids:
+            return []
+
+        await self._ensure_authenticated()
+        client = self._get_client()
+        url = f"{self.api_url}/reader/api/0/stream/items/contents"
+
+        # One 'i' parameter per article ID, like edit-tag
+        encoded_data = "&".join(f"i={quote(article_id, safe='')}" for article_id in article_ids)
+
+        try:
+            response = await client.post(
+                url,
+                params={"output": "json"},
+                content=encoded_data,
             )
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise APIError(
-                f"Failed to get article IDs: {e.response.status_code}",
+                f"Failed to get items: {e.response.status_code}",
                 e.response.status_code,
             ) from e
 
-        data = response.json()
-        # Response format: {"itemRefs": [{"id": "..."}, ...]}
-        return [item["id"] for item in data.get("itemRefs", [])]
+        return StreamContents.model_validate_json(response.content).items
 
     # =========================================================================
     # State Management
@@ -390,6 +696,23 @@ class FreshRSSClient:
         Raises:
             APIError: If request fails.
         """
+        return await self.mark_as_read_count(article_ids) == len(article_ids)
+
+    async def mark_as_read_count(self, article_ids: list[str]) -> int:
+        """Mark articles as read and report how many were marked.
+
+        Large lists are sent in batches, so some can succeed while others
+        fail; use this instead of mark_as_read to get the partial count.
+
+        Args:
+            article_ids: List of article IDs to mark as read
+
+        Returns:
+            Number of articles marked as read.
+
+        Raises:
+            APIError: If request fails (for batched lists, only if every batch failed).
+        """
         return await self._edit_tag(article_ids, add_tag=STATE_READ)
 
     async def mark_as_starred(self, article_ids: list[str]) -> bool:
@@ -404,53 +727,99 @@ class FreshRSSClient:
         Raises:
             APIError: If request fails.
         """
-        return await self._edit_tag(article_ids, add_tag=STATE_STARRED)
+        return await self._edit_tag(article_ids, add_tag=STATE_STARRED) == len(article_ids)
 
     async def _edit_tag(
         self,
         article_ids: list[str],
         add_tag: str | None = None,
         remove_tag: str | None = None,
-    ) -> bool:
+    ) -> int:
         """Edit tags on articles.
 
+        Lists longer than EDIT_TAG_BATCH_SIZE are split into chunks that are
+        sent concurrently and share a single action token. Chunks succeed or
+        fail independently, so the result counts only the articles in chunks
+        the server accepted.
+
         Args:
             article_ids: List of article IDs
             add_tag: Tag to add
             remove_tag: Tag to remove
 
         Returns:
-            True if successful.
+            Number of articles whose tags were edited.
 
         Raises:
-            APIError: If request fails.
+            APIError: If request fails (for chunked lists, only if every chunk failed).
         """
         if not article_ids:
-            return True
+            return 0
 
         await self._ensure_authenticated()
         token = await self._ensure_action_token()
-        client = self._get_client()
-        url = f"{self.api_url}/reader/api/0/edit-tag"
 
-        # Build form data with multiple 'i' parameters for each article ID
-        form_data: list[tuple[str, str]] = [("T", token)]
-        for article_id in article_ids:
-            form_data.append(("i", article_id))
-        if add_tag:
-            form_data.append(("a", add_tag))
-        if remove_tag:
-            form_data.append(("r", remove_tag))
+        try:
+            if len(article_ids) <= EDIT_TAG_BATCH_SIZE:
+                ok = await self._edit_tag_with_token(article_ids, token, add_tag, remove_tag)
+                return len(article_ids) if ok else 0
+
+            chunks = [
+                article_ids[i : i + EDIT_TAG_BATCH_SIZE]
+                for i in range(0, len(article_ids), EDIT_TAG_BATCH_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(self._edit_tag_with_token(chunk, token, add_tag, remove_tag) for chunk in chunks),
+                return_exceptions=True,
+            )
 
-        # Use urlencode to explicitly encode form data (handles duplicate keys correctly)
-        encoded_data = urlencode(form_data)
+            edited = 0
+            error: BaseException | None = None
+            for chunk, result in zip(chunks, results, strict=True):
+                if isinstance(result, BaseException):
+                    error = error or result
+                elif result:
+                    edited += len(chunk)
+            if error is not None:
+                if not edited:
+                    raise error
+                logger.warning("Edit-tag failed for some chunks: %s", error)
+            return edited
+        finally:
+            # Unread counts may have changed, even if some chunks failed
+            self.invalidate()
+
+    async def _edit_tag_with_token(
+        self,
+        article_ids: list[str],
+        token: str,
+        add_tag: str | None = None,
+        remove_tag: str | None = None,
+    ) -> bool:
+        """Edit tags on one batch of articles using an existing action token.
+
+        Args:
+            article_ids: List of article IDs
+            token: Action token
+            add_tag: Tag to add
+            remove_tag: Tag to remove
+
+        Returns:
+            True if successful.
+
+        Raises:
+            APIError: If request fails.
+        """
+        response = await self._post_edit_tag(article_ids, token, add_tag, remove_tag)
+
+        # A cached action token may have expired server-side: refresh and retry once
+        if response.status_code == 401 or (response.is_success and response.text.strip() != "OK"):
+            if self._action_token == token:
+                self._invalidate_action_token()
+            token = await self._ensure_action_token()
+            response = await self._post_edit_tag(article_ids, token, add_tag, remove_tag)
 
         try:
-            response = await client.post(
-                url,
-                content=encoded_data,
-                headers=self._get_headers(),
-            )
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise APIError(
@@ -459,3 +828,38 @@ class FreshRSSClient:
             ) from e
 
         return response.text.strip() == "OK"
+
+    async def _post_edit_tag(
+        self,
+        article_ids: list[str],
+        token: str,
+        add_tag: str | None = None,
+        remove_tag: str | None = None,
+    ) -> httpx.Response:
+        """Send a single edit-tag request.
+
+        Args:
+            article_ids: List of article IDs
+            token: Action token
+            add_tag: Tag to add
+            remove_tag: Tag to remove
+
+        Returns:
+            Raw edit-tag response; status is checked by the caller.
+        """
+        client = self._get_client()
+        url = f"{self.api_url}/reader/api/0/edit-tag"
+
+        # Encode the form body in one pass, with one 'i' parameter per article ID
+        parts = [f"T={quote(token, safe='')}"]
+        parts.extend([f"i={quote(article_id, safe='')}" for article_id in article_ids])
+        if add_tag:
+            parts.append(f"a={_quote_stream_id(add_tag)}")
+        if remove_tag:
+            parts.append(f"r={_quote_stream_id(remove_tag)}")
+        encoded_data = "&".join(parts)
+
+        return await client.post(
+            url,
+            content=encoded_data,
+        )
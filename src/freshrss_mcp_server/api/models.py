@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field
 
 # =============================================================================
 # Authentication Models
@@ -78,7 +78,6 @@ class Article(BaseModel):
     summary: ArticleSummary | None = None
     origin: ArticleOrigin | None = None
 
-    @computed_field
     @property
     def link(self) -> str | None:
         """Get article URL from canonical or alternate links."""
@@ -88,12 +87,6 @@ class Article(BaseModel):
             return self.alternate[0].get("href")
         return None
 
-    @computed_field
-    @property
-    def published_at(self) -> datetime:
-        """Get published timestamp as datetime."""
-        return datetime.fromtimestamp(self.published, tz=UTC)
-
 
 class StreamContents(BaseModel):
     """Response from stream/contents endpoint."""
@@ -149,7 +142,7 @@ class ArticleResponse(BaseModel):
             title=article.title,
             summary=article.summary.content if article.summary else "",
             link=article.link,
-            published=article.published_at,
+            published=datetime.fromtimestamp(article.published, tz=UTC),
             feed_title=article.origin.title if article.origin else "",
             feed_id=article.origin.stream_id if article.origin else "",
         )
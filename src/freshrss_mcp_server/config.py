@@ -20,6 +20,13 @@ class Settings(BaseSettings):
     request_timeout: int = 30
     default_article_limit: int = 100
 
+    # In-process cache TTLs in seconds (0 disables caching)
+    subscriptions_cache_ttl: float = 60.0
+    unread_counts_cache_ttl: float = 5.0
+
+    # Maximum concurrent HTTP connections to FreshRSS
+    http_max_connections: int = 50
+
     # Dynamic fetch settings (Playwright)
     enable_dynamic_fetch: bool = True
     browser_timeout: int = 30
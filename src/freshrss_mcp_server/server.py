@@ -2,17 +2,21 @@
 
 import argparse
 import asyncio
-import atexit
+import contextlib
+import hmac
 import logging
 import signal
 import sys
+from collections.abc import AsyncIterator
 from typing import Any
 
+import orjson
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
 
 from freshrss_mcp_server import __version__
 from freshrss_mcp_server.api.client import FreshRSSClient
-from freshrss_mcp_server.config import get_settings
+from freshrss_mcp_server.config import Settings, get_settings
 from freshrss_mcp_server.tools import articles, browser, fetcher
 
 # Logger will be configured in main() based on settings
@@ -22,82 +26,119 @@ logger = logging.getLogger("freshrss-mcp")
 def _configure_logging(level: str) -> None:
     """Configure logging with the specified level."""
     log_level = getattr(logging, level.upper(), logging.INFO)
+    # Skip collecting thread/process info that the format never prints
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
         level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format="%(asctime)s %(levelname).1s %(name)s %(message)s",
+        datefmt="%H:%M:%S",
         force=True,
     )
+    # Drop records below the configured level in one manager-level check,
+    # before any logger walks its hierarchy or builds a LogRecord
+    logging.disable(log_level - 1 if log_level > logging.DEBUG else logging.NOTSET)
 
 
-# Global client instance (initialized lazily)
+# Global client instance (created by the first create_server() call)
 _client: FreshRSSClient | None = None
 
-# Shutdown flag to prevent multiple cleanup calls
-_shutdown_in_progress = False
+
+async def _close_resources() -> None:
+    """Close the shared article-fetch HTTP client and the browser."""
+    try:
+        await fetcher.close_http_client()
+    finally:
+        await browser.close_browser()
 
 
-def _run_cleanup() -> None:
-    """Run async cleanup in a new event loop (for atexit handler)."""
-    global _shutdown_in_progress
-    if _shutdown_in_progress:
-        return
-    _shutdown_in_progress = True
+async def _run_stdio(server: FastMCP) -> None:
+    """Serve over stdio, then close shared resources on the same event loop.
 
-    logger.info("Running cleanup...")
+    The pooled HTTP client and the browser are bound to the loop they were
+    used on, so they must be closed before asyncio.run() tears it down. On
+    SIGINT/SIGTERM the task is cancelled and the finally block still runs.
+    """
     try:
-        loop = asyncio.new_event_loop()
-        loop.run_until_complete(browser.close_browser())
-        loop.close()
-    except Exception as e:
-        logger.warning("Cleanup error: %s", e)
-    logger.info("Cleanup complete")
+        await server.run_stdio_async()
+    finally:
+        logger.info("Running cleanup...")
+        try:
+            await _close_resources()
+        except Exception as e:
+            logger.warning("Cleanup error: %s", e)
+        logger.info("Cleanup complete")
 
 
-def _signal_handler(signum: int, frame: Any) -> None:
-    """Handle shutdown signals (SIGTERM, SIGINT)."""
-    sig_name = signal.Signals(signum).name
-    logger.info("Received %s, initiating graceful shutdown...", sig_name)
-    _run_cleanup()
-    sys.exit(0)
+def _close_resources_on_shutdown(app: Starlette) -> None:
+    """Close shared resources from the HTTP app's lifespan, after its own shutdown.
+
+    uvicorn handles SIGINT/SIGTERM itself and runs lifespan shutdown, so
+    cleanup happens on the server's event loop with no extra handlers.
+    """
+    app_lifespan = app.router.lifespan_context
 
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        try:
+            async with app_lifespan(app):
+                yield
+        finally:
+            await _close_resources()
 
-def _setup_signal_handlers() -> None:
-    """Register signal handlers for graceful shutdown."""
-    signal.signal(signal.SIGTERM, _signal_handler)
-    signal.signal(signal.SIGINT, _signal_handler)
-    atexit.register(_run_cleanup)
-    logger.debug("Signal handlers registered")
+    app.router.lifespan_context = lifespan
 
 
-async def get_client() -> FreshRSSClient:
+def get_client(settings: Settings | None = None) -> FreshRSSClient:
     """Get or create FreshRSS API client.
 
+    The client opens its HTTP connection pool lazily, so creating it needs
+    no running event loop.
+
+    Args:
+        settings: Application settings (default: loaded from environment)
+
     Returns:
         Initialized FreshRSSClient instance.
     """
     global _client
     if _client is None:
-        settings = get_settings()
+        if settings is None:
+            settings = get_settings()
         _client = FreshRSSClient(
             api_url=settings.freshrss_api_url,
             username=settings.freshrss_username,
             password=settings.freshrss_api_password,
             timeout=settings.request_timeout,
+            subscriptions_cache_ttl=settings.subscriptions_cache_ttl,
+            unread_counts_cache_ttl=settings.unread_counts_cache_ttl,
+            max_connections=settings.http_max_connections,
         )
         logger.info("FreshRSS client initialized for %s", settings.freshrss_api_url)
     return _client
 
 
-def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    settings: Settings | None = None,
+) -> FastMCP:
     """Create and configure the MCP server with all tools.
 
     Args:
         host: Host to bind for HTTP mode
         port: Port for HTTP mode
+        settings: Application settings (default: loaded from environment)
 
     Returns:
         Configured FastMCP server instance
     """
+    if settings is None:
+        settings = get_settings()
+    timeout = settings.request_timeout
+    client = get_client(settings)
+
     server = FastMCP("freshrss", host=host, port=port)
 
     # Register all tools
@@ -118,7 +159,6 @@ def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
         Returns:
             List of articles with id, title, summary, link, published, feed_title
         """
-        client = await get_client()
         return await articles.get_unread_articles(client, limit=limit, feed_id=feed_id)
 
     @server.tool()
@@ -134,7 +174,6 @@ def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
         Returns:
             Article with full content including id, title, content, link, published
         """
-        client = await get_client()
         return await articles.get_article_content(client, article_id=article_id)
 
     @server.tool()
@@ -150,7 +189,6 @@ def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
         Returns:
             Operation result with success status and count of articles marked
         """
-        client = await get_client()
         return await articles.mark_as_read(client, article_ids=article_ids)
 
     @server.tool()
@@ -163,7 +201,6 @@ def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
         Returns:
             List of subscriptions with id, title, url, unread_count, category
         """
-        client = await get_client()
         return await articles.get_subscriptions(client)
 
     @server.tool()
@@ -188,24 +225,57 @@ def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
             Extracted article content with title, text, author, date, and method.
             The 'method' field indicates 'static' or 'dynamic' fetch was used.
         """
-        app_settings = get_settings()
         return await fetcher.fetch_full_article(
             url,
             force_dynamic=force_dynamic,
-            timeout=app_settings.request_timeout,
+            timeout=timeout,
         )
 
+    @server.tool()
+    async def fetch_full_articles(urls: list[str]) -> list[dict[str, Any]]:
+        """Fetch full article content from several original URLs at once.
+
+        Use this tool instead of calling fetch_full_article repeatedly when
+        several summary-only articles need their complete text. Pages are
+        fetched concurrently using fast static fetching.
+
+        Args:
+            urls: The original article URLs to fetch
+
+        Returns:
+            One result per URL, in the same order. Each is either extracted
+            article content (title, text, author, date, method) or an error.
+            For pages that need JavaScript rendering, call fetch_full_article
+            with force_dynamic=True.
+        """
+        return await fetcher.fetch_full_articles(urls, timeout=timeout)
+
     return server
 
 
-# Default server instance for module-level access
-mcp = create_server()
+# Default server instance, created lazily by __getattr__ (declared for type checkers)
+mcp: FastMCP
+
+
+def __getattr__(name: str) -> Any:
+    """Create the default server instance on first module-level access (PEP 562)."""
+    if name == "mcp":
+        global mcp
+        mcp = create_server()
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
 # Entry Point
 # =============================================================================
 
+# CORS policy for browser-based clients in HTTP mode
+_CORS_ORIGINS = ("*",)
+_CORS_METHODS = ("GET", "POST", "DELETE", "OPTIONS")
+_CORS_HEADERS = ("mcp-protocol-version", "mcp-session-id", "Authorization", "Content-Type")
+_CORS_EXPOSE = ("mcp-session-id",)
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments.
@@ -215,6 +285,14 @@ def parse_args() -> argparse.Namespace:
     # Get defaults from config (environment variables)
     settings = get_settings()
 
+    # No flags (the usual container case): skip building the parser
+    if len(sys.argv) == 1:
+        return argparse.Namespace(
+            transport=settings.mcp_transport,
+            host=settings.mcp_host,
+            port=settings.mcp_port,
+        )
+
     parser = argparse.ArgumentParser(
         description="FreshRSS MCP Server - Connect AI applications to FreshRSS",
     )
@@ -251,24 +329,35 @@ def main() -> None:
     # Configure logging based on settings
     _configure_logging(settings.log_level)
 
-    # Setup graceful shutdown handlers
-    _setup_signal_handlers()
-
     logger.info("Starting FreshRSS MCP Server v%s", __version__)
     logger.info("Transport: %s", args.transport)
     logger.info("Log level: %s", settings.log_level)
 
     if args.transport == "stdio":
-        # Use default server for STDIO mode
-        mcp.run()
+        # STDIO mode needs no host/port, so build the server directly
+        # Deliver SIGTERM like Ctrl-C so the server task unwinds and cleans up;
+        # HTTP modes leave signals to uvicorn, which handles them on its loop
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        # Same as FastMCP.run("stdio"), but on uvloop when it is installed
+        try:
+            import uvloop
+
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            loop_factory = None
+        logger.debug("Event loop: %s", "uvloop" if loop_factory else "asyncio")
+        server = create_server(settings=settings)
+        try:
+            asyncio.run(_run_stdio(server), loop_factory=loop_factory)
+        except KeyboardInterrupt:
+            logger.info("Shutting down")
     else:
         # HTTP modes (SSE or Streamable HTTP)
         import uvicorn
         from starlette.middleware.cors import CORSMiddleware
-        from starlette.responses import JSONResponse
-        from starlette.routing import Route
+        from starlette.types import ASGIApp, Receive, Scope, Send
 
-        server = create_server(host=args.host, port=args.port)
+        server = create_server(host=args.host, port=args.port, settings=settings)
 
         # Get the appropriate Starlette app based on transport mode
         if args.transport == "sse":
@@ -278,82 +367,114 @@ def main() -> None:
             app = server.streamable_http_app()
             mcp_endpoint = "/mcp"
 
-        # Add health check endpoint
-        async def health_check(request: Any) -> JSONResponse:
-            return JSONResponse(
-                {
-                    "status": "healthy",
-                    "version": __version__,
-                    "transport": args.transport,
-                }
-            )
-
-        app.routes.append(Route("/health", health_check, methods=["GET"]))
+        _close_resources_on_shutdown(app)
 
         # Add API key authentication middleware (if API_KEY is set)
         # NOTE: Use pure ASGI middleware instead of BaseHTTPMiddleware
         # because BaseHTTPMiddleware is incompatible with SSE streaming responses
         if settings.api_key:
-            from starlette.types import ASGIApp, Receive, Scope, Send
 
             class AuthMiddleware:
-                def __init__(self, app: ASGIApp) -> None:
+                # Prebuilt 401 responses, sent as raw ASGI messages
+                MISSING_BODY = orjson.dumps({"error": "Missing or invalid Authorization header"})
+                INVALID_BODY = orjson.dumps({"error": "Invalid API key"})
+
+                def __init__(self, app: ASGIApp, api_key: str) -> None:
                     self.app = app
+                    self.expected = b"Bearer " + api_key.encode()
 
                 async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
                     if scope["type"] != "http":
                         await self.app(scope, receive, send)
                         return
 
-                    # Skip auth for health check endpoint
-                    if scope["path"] == "/health":
-                        await self.app(scope, receive, send)
-                        return
-
-                    # Check Authorization header
-                    headers = dict(scope.get("headers", []))
-                    auth_header = headers.get(b"authorization", b"").decode()
+                    # Check Authorization header (ASGI header names are lowercase bytes)
+                    auth_header = b""
+                    for name, value in scope["headers"]:
+                        if name == b"authorization":
+                            auth_header = value
+                            break
 
-                    if not auth_header.startswith("Bearer "):
-                        response = JSONResponse(
-                            {"error": "Missing or invalid Authorization header"},
-                            status_code=401,
-                        )
-                        await response(scope, receive, send)
+                    if not auth_header.startswith(b"Bearer "):
+                        await self._reject(send, self.MISSING_BODY)
                         return
 
-                    token = auth_header[7:]  # Remove "Bearer " prefix
-                    if token != settings.api_key:
-                        response = JSONResponse(
-                            {"error": "Invalid API key"},
-                            status_code=401,
-                        )
-                        await response(scope, receive, send)
+                    if not hmac.compare_digest(auth_header, self.expected):
+                        await self._reject(send, self.INVALID_BODY)
                         return
 
                     await self.app(scope, receive, send)
 
-            app.add_middleware(AuthMiddleware)  # type: ignore[arg-type]
+                @staticmethod
+                async def _reject(send: Send, body: bytes) -> None:
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": 401,
+                            "headers": [
+                                (b"content-type", b"application/json"),
+                                (b"content-length", str(len(body)).encode()),
+                            ],
+                        }
+                    )
+                    await send({"type": "http.response.body", "body": body})
+
+            app.add_middleware(AuthMiddleware, api_key=settings.api_key)  # type: ignore[arg-type]
             logger.info("API authentication enabled")
 
         # Add CORS middleware for browser-based clients
         app.add_middleware(
             CORSMiddleware,  # type: ignore[arg-type]
-            allow_origins=["*"],
-            allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
-            allow_headers=[
-                "mcp-protocol-version",
-                "mcp-session-id",
-                "Authorization",
-                "Content-Type",
-            ],
-            expose_headers=["mcp-session-id"],
+            allow_origins=_CORS_ORIGINS,
+            allow_methods=_CORS_METHODS,
+            allow_headers=_CORS_HEADERS,
+            expose_headers=_CORS_EXPOSE,
+        )
+
+        # Health check endpoint, answered ahead of the middleware stack so probes
+        # skip CORS and auth. The payload is fixed for the process lifetime.
+        health_body = orjson.dumps(
+            {
+                "status": "healthy",
+                "version": __version__,
+                "transport": args.transport,
+            }
         )
+        health_start = {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(health_body)).encode()),
+            ],
+        }
+        health_message = {"type": "http.response.body", "body": health_body}
+        mcp_app: ASGIApp = app
+
+        async def asgi_app(scope: Scope, receive: Receive, send: Send) -> None:
+            if (
+                scope["type"] == "http"
+                and scope["path"] == "/health"
+                and scope["method"] in ("GET", "HEAD")
+            ):
+                await send(health_start)
+                await send(health_message)
+                return
+            # Everything else, including lifespan events, goes to the MCP app
+            await mcp_app(scope, receive, send)
 
         logger.info("HTTP Server: http://%s:%d", args.host, args.port)
         logger.info("MCP endpoint: http://%s:%d%s", args.host, args.port, mcp_endpoint)
         logger.info("Health check: http://%s:%d/health", args.host, args.port)
-        uvicorn.run(app, host=args.host, port=args.port)
+        # uvloop is optional (not available on Windows); fall back to asyncio's loop
+        try:
+            import uvloop  # noqa: F401
+
+            loop = "uvloop"
+        except ImportError:
+            loop = "asyncio"
+        logger.debug("Event loop: %s", loop)
+        uvicorn.run(asgi_app, host=args.host, port=args.port, loop=loop)
 
 
 if __name__ == "__main__":
@@ -6,10 +6,11 @@ from freshrss_mcp_server.tools.articles import (
     get_unread_articles,
     mark_as_read,
 )
-from freshrss_mcp_server.tools.fetcher import fetch_full_article
+from freshrss_mcp_server.tools.fetcher import fetch_full_article, fetch_full_articles
 
 __all__ = [
     "fetch_full_article",
+    "fetch_full_articles",
     "get_article_content",
     "get_subscriptions",
     "get_unread_articles",
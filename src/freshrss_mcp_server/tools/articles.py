@@ -1,14 +1,21 @@
 """Article-related MCP tools for FreshRSS."""
 
 import logging
+from datetime import UTC, datetime
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from freshrss_mcp_server.api.client import FreshRSSClient
 from freshrss_mcp_server.api.models import ArticleResponse, SubscriptionResponse
 from freshrss_mcp_server.exceptions import APIError, FreshRSSError
 
 logger = logging.getLogger(__name__)
 
+# Serialize whole response lists in a single pydantic-core call
+ARTICLE_RESPONSES_ADAPTER = TypeAdapter(list[ArticleResponse])
+SUBSCRIPTION_RESPONSES_ADAPTER = TypeAdapter(list[SubscriptionResponse])
+
 
 async def get_unread_articles(
     client: FreshRSSClient,
@@ -27,9 +34,9 @@ async def get_unread_articles(
     """
     try:
         articles = await client.get_unread_articles(limit=limit, feed_id=feed_id)
-        return [
-            ArticleResponse.from_article(article).model_dump(mode="json") for article in articles
-        ]
+        return ARTICLE_RESPONSES_ADAPTER.dump_python(
+            [ArticleResponse.from_article(article) for article in articles], mode="json"
+        )
     except APIError as e:
         logger.error("Failed to get unread articles: %s", e)
         return [{"error": True, "message": str(e), "code": "API_ERROR"}]
@@ -52,24 +59,27 @@ async def get_article_content(
         Article with full content including id, title, content, link, published
     """
     try:
-        # Get the article by fetching stream contents with the specific article
-        # The article_id in Google Reader API is like "tag:google.com,2005:reader/item/..."
-        stream = await client.get_stream_contents(
-            stream_id="user/-/state/com.google/reading-list",
-            count=1000,  # Fetch more to find the article
-        )
-
-        for article in stream.items:
-            if article.id == article_id:
-                return {
-                    "id": article.id,
-                    "title": article.title,
-                    "content": article.summary.content if article.summary else "",
-                    "link": article.link,
-                    "published": article.published_at.isoformat(),
-                    "feed_title": article.origin.title if article.origin else "",
-                    "feed_id": article.origin.stream_id if article.origin else "",
-                }
+        # Fetch just this item; the article_id in Google Reader API is like
+        # "tag:google.com,2005:reader/item/..."
+        items = await client.get_items_contents([article_id])
+        if items:
+            article = items[0]
+            # Branch on origin once rather than per field
+            origin = article.origin
+            if origin:
+                feed_title, feed_id = origin.title, origin.stream_id
+            else:
+                feed_title = feed_id = ""
+            summary = article.summary
+            return {
+                "id": article.id,
+                "title": article.title,
+                "content": summary.content if summary else "",
+                "link": article.link,
+                "published": datetime.fromtimestamp(article.published, tz=UTC).isoformat(),
+                "feed_title": feed_title,
+                "feed_id": feed_id,
+            }
 
         return {"error": True, "message": f"Article not found: {article_id}", "code": "NOT_FOUND"}
 
@@ -98,12 +108,19 @@ async def mark_as_read(
         return {"success": True, "marked_count": 0, "message": "No articles to mark"}
 
     try:
-        success = await client.mark_as_read(article_ids)
-        if success:
+        marked = await client.mark_as_read_count(article_ids)
+        if marked == len(article_ids):
             return {
                 "success": True,
-                "marked_count": len(article_ids),
-                "message": f"Successfully marked {len(article_ids)} article(s) as read",
+                "marked_count": marked,
+                "message": f"Successfully marked {marked} article(s) as read",
+            }
+        elif marked:
+            # Large lists are sent in batches; some were applied before others failed
+            return {
+                "success": False,
+                "marked_count": marked,
+                "message": f"Marked {marked} of {len(article_ids)} article(s) as read",
             }
         else:
             return {
@@ -131,15 +148,8 @@ async def get_subscriptions(
         List of subscriptions with id, title, url, unread_count, category
     """
     try:
-        subscriptions = await client.get_subscriptions()
-        unread_counts = await client.get_unread_counts()
-
-        return [
-            SubscriptionResponse.from_subscription(
-                sub, unread_count=unread_counts.get(sub.id, 0)
-            ).model_dump(mode="json")
-            for sub in subscriptions
-        ]
+        subscriptions = await client.get_subscriptions_with_unread()
+        return SUBSCRIPTION_RESPONSES_ADAPTER.dump_python(subscriptions, mode="json")
     except APIError as e:
         logger.error("Failed to get subscriptions: %s", e)
         return [{"error": True, "message": str(e), "code": "API_ERROR"}]
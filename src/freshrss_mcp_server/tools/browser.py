@@ -1,12 +1,23 @@
 """Playwright browser wrapper for dynamic content fetching."""
 
+import asyncio
+import contextlib
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Number of pages kept open for reuse across fetches
+PAGE_POOL_SIZE = 4
+# Extra wait for network activity to settle after DOMContentLoaded (milliseconds)
+NETWORK_IDLE_TIMEOUT = 5000
+
 # Lazy-loaded browser instance (singleton)
 _playwright = None
 _browser = None
+# Shared browser context and its pool of idle pages
+_context = None
+_pages: asyncio.Queue | None = None
+_pool_lock = asyncio.Lock()
 
 
 async def _get_browser():
@@ -27,28 +38,96 @@ async def _get_browser():
     return _browser
 
 
+async def _get_page_pool() -> asyncio.Queue:
+    """Get or create the pool of reusable pages.
+
+    All pages share one browser context, so its HTTP cache and connections
+    stay warm between fetches instead of starting cold for every page.
+
+    Returns:
+        Queue of idle Playwright pages.
+    """
+    global _context, _pages
+
+    async with _pool_lock:
+        if _pages is None:
+            browser = await _get_browser()
+            _context = await browser.new_context(
+                user_agent="Mozilla/5.0 (compatible; FreshRSS-MCP/1.0)",
+                bypass_csp=True,
+            )
+            pages: asyncio.Queue = asyncio.Queue()
+            for _ in range(PAGE_POOL_SIZE):
+                pages.put_nowait(await _context.new_page())
+            _pages = pages
+            logger.info("Playwright page pool initialized (%d pages)", PAGE_POOL_SIZE)
+
+    return _pages
+
+
 async def close_browser() -> None:
     """Close browser and cleanup resources.
 
     Should be called when the application shuts down.
     """
-    global _playwright, _browser
+    global _playwright, _browser, _context, _pages
 
-    if _browser:
-        await _browser.close()
-        _browser = None
-        logger.info("Playwright browser closed")
+    # Reset the singletons first, so a failed close still lets the next
+    # fetch launch a fresh browser
+    playwright, browser, context = _playwright, _browser, _context
+    _playwright = _browser = _context = _pages = None
+
+    try:
+        if context:
+            await context.close()
+    finally:
+        try:
+            if browser:
+                await browser.close()
+                logger.info("Playwright browser closed")
+        finally:
+            if playwright:
+                await playwright.stop()
 
-    if _playwright:
-        await _playwright.stop()
-        _playwright = None
+
+async def _release_page(pages: asyncio.Queue, page) -> None:
+    """Return a borrowed page to its pool, blanked, or replaced if it was closed.
+
+    If the browser is gone (crashed or disconnected), the whole pool is torn
+    down instead, so the next fetch starts a fresh browser rather than
+    waiting on a pool that can never refill.
+    """
+    if pages is not _pages or _context is None:
+        # The pool was closed or reset while the page was in use
+        return
+
+    if _browser is not None and _browser.is_connected():
+        try:
+            if page.is_closed():
+                # Replace a page that crashed or was closed by the site
+                page = await _context.new_page()
+            else:
+                # Unload the site so its timers, sockets and scripts stop while idle
+                with contextlib.suppress(Exception):
+                    await page.goto("about:blank", timeout=NETWORK_IDLE_TIMEOUT)
+            pages.put_nowait(page)
+            return
+        except Exception as e:
+            logger.warning("Could not replace Playwright page: %s", e)
+
+    logger.warning("Playwright browser is unusable; resetting it")
+    try:
+        await close_browser()
+    except Exception as e:
+        logger.debug("Error closing Playwright browser: %s", e)
 
 
 async def fetch_rendered_html(url: str, timeout: int = 30) -> str:
     """Fetch page HTML after JavaScript rendering.
 
-    Uses Playwright to load the page and wait for network idle,
-    then returns the fully rendered HTML content.
+    Uses a pooled Playwright page to load the page until DOMContentLoaded,
+    waits briefly for network activity to settle, then returns the rendered
+    HTML content.
 
     Args:
         url: The URL to fetch
@@ -59,13 +138,24 @@ async def fetch_rendered_html(url: str, timeout: int = 30) -> str:
 
     Raises:
         PlaywrightError: If page loading fails
+        TimeoutError: If no pooled page becomes free within the timeout
     """
-    browser = await _get_browser()
-    page = await browser.new_page()
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    pages = await _get_page_pool()
+    try:
+        page = await asyncio.wait_for(pages.get(), timeout)
+    except TimeoutError:
+        raise TimeoutError(f"No browser page became free within {timeout}s") from None
 
     try:
-        await page.goto(url, timeout=timeout * 1000, wait_until="networkidle")
+        await page.goto(url, timeout=timeout * 1000, wait_until="domcontentloaded")
+        try:
+            # Pages with polling or analytics never go idle; don't wait out the full timeout
+            await page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            pass
         html = await page.content()
         return html
     finally:
-        await page.close()
+        await _release_page(pages, page)
@@ -1,88 +1,447 @@
 """Full article fetcher with fallback to dynamic rendering."""
 
+import asyncio
 import logging
+import re
+import zlib
+from collections import OrderedDict
 from typing import Any
 
 import httpx
 import trafilatura
+from selectolax.lexbor import LexborHTMLParser
+from trafilatura.settings import Document
+
+try:
+    import brotli
+except ImportError:  # PyPy installs the CFFI binding (same as httpx[brotli])
+    import brotlicffi as brotli  # ty: ignore[unresolved-import]
 
 from freshrss_mcp_server.config import get_settings
+from freshrss_mcp_server.exceptions import FetchError
 
 logger = logging.getLogger(__name__)
 
+# Largest page body read for extraction; bigger pages are rejected
+MAX_HTML_BYTES = 5 * 1024 * 1024
+# Content types worth extracting (a missing Content-Type is also accepted)
+HTML_CONTENT_TYPES = ("text/", "application/xhtml")
+# Encodings advertised to servers; bodies are read raw and decompressed by _decode_body
+ACCEPT_ENCODING = "br, gzip, deflate"
+# Uncompressed bodies up to this many bytes are decoded on the event loop;
+# bigger or compressed ones are decoded in a worker thread
+INLINE_DECODE_BYTES = 64 * 1024
+
+# SPA shells with less visible body text than this skip static extraction
+MIN_VISIBLE_TEXT = 200
+# Mount points of common SPA frameworks (React, Vue, Next.js, Nuxt, Angular)
+_SPA_MOUNT_SELECTOR = "#root, #app, #__next, #__nuxt, app-root"
+# Elements whose text is never shown on the page
+_HIDDEN_TEXT_TAGS = ["script", "style", "noscript", "template"]
+
+# Fast-path extractions shorter than this fall back to trafilatura
+FAST_EXTRACT_MIN_TEXT = 500
+# Non-content elements removed from the article body before reading its text
+_FAST_STRIP_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "nav",
+    "aside",
+    "footer",
+    "form",
+    "figure",
+    "iframe",
+]
+# Separator between a page title and the site name ("Post | Site", "Post - Site")
+_TITLE_SUFFIX_RE = re.compile(r"\s+(?:[|·•–—]|-{1,2}|::)\s+.*$")
+# Text blocks read from the article body, in document order
+_FAST_BLOCKS = "h1, h2, h3, h4, h5, h6, p, li, pre, blockquote"
+
+# Extracted static results kept for revalidation with ETag/Last-Modified
+RESULT_CACHE_SIZE = 512
+# URL -> (result, ETag, Last-Modified), least recently used first
+_result_cache: OrderedDict[str, tuple[dict[str, Any], str | None, str | None]] = OrderedDict()
+
+# Upper bound on article fetches in flight at once for batch requests
+MAX_CONCURRENT_FETCHES = 64
+_fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+# Shared HTTP client for article pages (singleton), so connections and TLS
+# sessions are reused across fetches
+_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client.
+
+    Returns:
+        Pooled httpx AsyncClient instance.
+    """
+    global _client
+
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0,
+            ),
+            headers={
+                "User-Agent": "Mozilla/5.0 (compatible; FreshRSS-MCP/1.0)",
+                "Accept": "text/html,application/xhtml+xml,*/*",
+                "Accept-Encoding": ACCEPT_ENCODING,
+            },
+        )
+
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client.
+
+    Should be called when the application shuts down.
+    """
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
-async def _fetch_static(url: str, timeout: int) -> str:
+
+async def _fetch_static(
+    url: str,
+    timeout: int,
+    headers: dict[str, str] | None = None,
+) -> tuple[str | None, httpx.Headers]:
     """Fetch HTML using httpx (static, no JS execution).
 
     Args:
         url: The URL to fetch
         timeout: Request timeout in seconds
+        headers: Extra request headers (e.g., conditional GET validators)
 
     Returns:
-        HTML content as string
+        Tuple of (HTML content, response headers). HTML is None if the
+        server answered 304 Not Modified.
 
     Raises:
+        FetchError: If the page is not HTML or exceeds MAX_HTML_BYTES
         httpx.HTTPStatusError: If HTTP request fails
         httpx.RequestError: If request fails
     """
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        response = await client.get(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; FreshRSS-MCP/1.0)",
-                "Accept": "text/html,application/xhtml+xml,*/*",
-            },
-        )
+    client = _get_http_client()
+    async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+        if response.status_code == 304:
+            return None, response.headers
         response.raise_for_status()
-        return response.text
 
+        # Reject binaries before reading the body
+        content_type = response.headers.get("Content-Type", "").lower()
+        if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+            raise FetchError(url, f"unsupported content type: {content_type}")
+
+        # Read the body still compressed; decompression happens in _decode_body
+        raw = bytearray()
+        async for chunk in response.aiter_raw(chunk_size=65536):
+            raw += chunk
+            if len(raw) > MAX_HTML_BYTES:
+                raise FetchError(url, f"page exceeds {MAX_HTML_BYTES} bytes")
+
+        content_encoding = response.headers.get("Content-Encoding", "")
+        charset = response.charset_encoding
+
+    # A small compressed body can still inflate to MAX_HTML_BYTES, so only
+    # plain bodies are cheap enough to decode on the loop
+    if content_encoding.strip().lower() in ("", "identity") and len(raw) <= INLINE_DECODE_BYTES:
+        html = _decode_body(url, raw, content_encoding, charset)
+    else:
+        html = await asyncio.to_thread(_decode_body, url, raw, content_encoding, charset)
+    return html, response.headers
+
+
+def _decompress(url: str, data: bytes, encoding: str) -> bytes:
+    """Undo one Content-Encoding, capping the output at MAX_HTML_BYTES.
+
+    Raises:
+        FetchError: If the encoding is unsupported, the data is corrupt,
+            or the decompressed page exceeds MAX_HTML_BYTES
+    """
+    limit = MAX_HTML_BYTES + 1
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            output = zlib.decompressobj(zlib.MAX_WBITS | 16).decompress(data, limit)
+        elif encoding == "deflate":
+            try:
+                output = zlib.decompressobj().decompress(data, limit)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib header
+                output = zlib.decompressobj(-zlib.MAX_WBITS).decompress(data, limit)
+        elif encoding == "br":
+            # The decoder stops growing its output at the limit, so bombs stay bounded
+            output = brotli.Decompressor().process(data, output_buffer_limit=limit)
+        else:
+            raise FetchError(url, f"unsupported content encoding: {encoding}")
+    except (zlib.error, brotli.error) as e:
+        raise FetchError(url, f"could not decompress {encoding} body: {e}") from e
+
+    if len(output) > MAX_HTML_BYTES:
+        raise FetchError(url, f"page exceeds {MAX_HTML_BYTES} bytes")
+    return output
+
+
+def _decode_body(
+    url: str,
+    raw: bytes | bytearray,
+    content_encoding: str,
+    charset: str | None,
+) -> str:
+    """Decompress and decode a raw page body.
+
+    Args:
+        url: The page URL (for error messages)
+        raw: Body bytes as received on the wire
+        content_encoding: Value of the Content-Encoding header
+        charset: Charset from the Content-Type header, if any
+
+    Returns:
+        Decoded HTML
+
+    Raises:
+        FetchError: If the body cannot be decompressed or is too large
+    """
+    body = bytes(raw)
+    # Encodings are listed in the order they were applied
+    for encoding in reversed(content_encoding.lower().split(",")):
+        encoding = encoding.strip()
+        if encoding and encoding != "identity":
+            body = _decompress(url, body, encoding)
+
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        # Unknown charset in Content-Type
+        return body.decode("utf-8", errors="replace")
+
+
+def _cache_result(
+    url: str,
+    result: dict[str, Any],
+    etag: str | None,
+    last_modified: str | None,
+) -> None:
+    """Store an extracted static result, evicting the least recently used."""
+    _result_cache[url] = (dict(result), etag, last_modified)
+    _result_cache.move_to_end(url)
+    if len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
 
-def _extract_content(html: str) -> dict[str, Any] | None:
-    """Extract article content using trafilatura.
+
+def _looks_js_rendered(tree: LexborHTMLParser) -> bool:
+    """Check whether a parsed page is an empty shell filled in by JavaScript.
+
+    Lets SPA pages skip a trafilatura parse whose result would be empty
+    anyway. Only pages with an SPA mount point and almost no visible body
+    text are flagged.
+
+    Args:
+        tree: Parsed page (hidden elements are removed from its body)
+
+    Returns:
+        True if the page should be fetched with dynamic rendering
+    """
+    body = tree.body
+    if body is None or tree.css_first(_SPA_MOUNT_SELECTOR) is None:
+        return False
+
+    body.strip_tags(_HIDDEN_TEXT_TAGS)
+    return len("".join(body.text(deep=True).split())) < MIN_VISIBLE_TEXT
+
+
+def _meta_content(tree: LexborHTMLParser, selector: str) -> str | None:
+    """Return the stripped content attribute of the first matching <meta> tag."""
+    node = tree.css_first(selector)
+    if node is None:
+        return None
+    return (node.attributes.get("content") or "").strip() or None
+
+
+def _fast_title(tree: LexborHTMLParser) -> str | None:
+    """Find the article title without the site name.
+
+    Tries og:title, then the page's only <h1>, then <title> with any
+    " | Site" style suffix removed.
+    """
+    title = _meta_content(tree, "meta[property='og:title']")
+    if title:
+        return title
+
+    headings = tree.css("h1")
+    if len(headings) == 1 and (title := " ".join(headings[0].text(deep=True).split())):
+        return title
+
+    title_node = tree.css_first("title")
+    if title_node is None:
+        return None
+    return _TITLE_SUFFIX_RE.sub("", " ".join(title_node.text(deep=True).split())) or None
+
+
+def _fast_extract(tree: LexborHTMLParser) -> dict[str, Any] | None:
+    """Extract article content from a single <article> or <main> element.
+
+    Uses the Lexbor HTML parser, which is several times faster than lxml.
+    Only handles pages with one clear article container whose text is fully
+    made of headings, paragraphs, lists, quotes and code blocks; everything
+    else (tables, text in bare <div>s, ...) is left to trafilatura.
+
+    Args:
+        tree: Parsed page (non-content elements are removed from it)
+
+    Returns:
+        Extracted content dict with content, title, author, date,
+        or None if the page needs full extraction
+    """
+    articles = tree.css("article")
+    if len(articles) > 1:
+        # Index or listing page with several teasers
+        return None
+    body = articles[0] if articles else tree.css_first("main")
+    if body is None:
+        return None
+
+    body.strip_tags(_FAST_STRIP_TAGS)
+    blocks: list[str] = []
+    captured = 0
+    for node in body.css(_FAST_BLOCKS):
+        # Blocks holding other blocks (a <p> or list inside <li>) are read
+        # through their children; css() also matches the node itself
+        if len(node.css(_FAST_BLOCKS)) > 1:
+            continue
+        words = node.text(deep=True).split()
+        if words:
+            blocks.append(" ".join(words))
+            captured += sum(map(len, words))
+
+    # Any visible text outside the captured blocks would be silently dropped
+    if captured < sum(map(len, body.text(deep=True).split())):
+        return None
+
+    content = "\n".join(blocks)
+    if len(content) < FAST_EXTRACT_MIN_TEXT:
+        return None
+
+    title = _fast_title(tree)
+    if title is None:
+        return None
+
+    result: dict[str, Any] = {"content": content, "title": title}
+
+    author = _meta_content(tree, "meta[name='author']")
+    if author is None:
+        author = _meta_content(tree, "meta[property='article:author']")
+        if author and author.startswith(("http://", "https://")):
+            # Profile URL rather than a name
+            author = None
+    if author:
+        result["author"] = author
+
+    date = _meta_content(tree, "meta[property='article:published_time']")
+    if date:
+        # Same YYYY-MM-DD form trafilatura reports
+        result["date"] = date[:10]
+
+    return result
+
+
+def _extract_content(
+    html: str,
+    tree: LexborHTMLParser | None = None,
+) -> dict[str, Any] | None:
+    """Extract article content, trying the fast Lexbor path before trafilatura.
 
     Args:
         html: Raw HTML content
+        tree: Lexbor parse of html, if the caller already has one
 
     Returns:
         Extracted content dict with content, title, author, date,
         or None if extraction fails
     """
-    extracted = trafilatura.extract(
-        html,
+    result = _fast_extract(tree if tree is not None else LexborHTMLParser(html))
+    if result is not None:
+        return result
+
+    # Parse once; bare_extraction works on a copy, so the retry can reuse the tree
+    tree = trafilatura.load_html(html)
+    if tree is None:
+        return None
+
+    document = trafilatura.bare_extraction(
+        tree,
         include_links=True,
         include_images=False,
         include_tables=True,
-        output_format="txt",
+        with_metadata=True,
     )
 
-    if not extracted:
+    # bare_extraction is typed Document | dict (the dict form needs as_dict=True)
+    if not isinstance(document, Document) or not document.text:
         # Retry with lenient settings
-        extracted = trafilatura.extract(
-            html,
+        document = trafilatura.bare_extraction(
+            tree,
             include_links=True,
             include_images=False,
             include_tables=True,
-            output_format="txt",
+            with_metadata=True,
             favor_recall=True,
         )
 
-    if not extracted:
+    if not isinstance(document, Document) or not document.text:
         return None
 
-    metadata = trafilatura.extract_metadata(html)
+    # Same text as extract(output_format="txt"): main text followed by comments
+    content = document.text
+    if document.comments:
+        content = f"{content}\n{document.comments}"
 
-    result: dict[str, Any] = {"content": extracted}
-    if metadata:
-        if metadata.title:
-            result["title"] = metadata.title
-        if metadata.author:
-            result["author"] = metadata.author
-        if metadata.date:
-            result["date"] = metadata.date
+    result = {"content": content}
+    if document.title:
+        result["title"] = document.title
+    if document.author:
+        result["author"] = document.author
+    if document.date:
+        result["date"] = document.date
 
     return result
 
 
+def _extract_static_content(html: str) -> tuple[dict[str, Any] | None, bool]:
+    """Extract a statically fetched page unless it is an empty JS shell.
+
+    Args:
+        html: Raw HTML content
+
+    Returns:
+        Tuple of (extracted content dict or None, whether the page looks
+        JS-rendered and was skipped)
+    """
+    tree = LexborHTMLParser(html)
+    if _looks_js_rendered(tree):
+        return None, True
+    return _extract_content(html, tree), False
+
+
+async def _extract_content_async(html: str) -> dict[str, Any] | None:
+    """Run _extract_content in a worker thread.
+
+    Extraction is CPU-bound HTML parsing; running it off the event loop keeps
+    other fetches and tool calls responsive.
+    """
+    return await asyncio.to_thread(_extract_content, html)
+
+
 async def fetch_full_article(
     url: str,
     force_dynamic: bool = False,
@@ -121,7 +480,7 @@ async def fetch_full_article(
             from freshrss_mcp_server.tools.browser import fetch_rendered_html
 
             html = await fetch_rendered_html(url, timeout=settings.browser_timeout)
-            result = _extract_content(html)
+            result = await _extract_content_async(html)
 
             if result:
                 result["url"] = url
@@ -149,13 +508,43 @@ async def fetch_full_article(
             }
 
     # ========== Static fetch (trafilatura) ==========
+    # Revalidate a cached result instead of downloading and parsing again
+    cached = _result_cache.get(url)
+    headers: dict[str, str] = {}
+    if cached:
+        _, etag, last_modified = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
     try:
-        html = await _fetch_static(url, timeout)
-        result = _extract_content(html)
+        html, response_headers = await _fetch_static(url, timeout, headers)
+        if html is None and cached:
+            _result_cache.move_to_end(url)
+            return dict(cached[0])
+
+        # Extraction is CPU-bound; keep it (and the JS-shell check) off the event loop
+        result, js_rendered = await asyncio.to_thread(_extract_static_content, html or "")
+        if js_rendered:
+            logger.info("Skipping static extraction of JS-rendered page: %s", url)
+            return {
+                "error": True,
+                "message": "Page content appears to be rendered by JavaScript",
+                "code": "EXTRACTION_FAILED",
+                "hint": "Try calling with force_dynamic=True for JS-rendered pages",
+            }
 
         if result:
             result["url"] = url
             result["method"] = "static"
+            etag = response_headers.get("ETag")
+            last_modified = response_headers.get("Last-Modified")
+            # Only pages with validators can be revalidated cheaply
+            if etag or last_modified:
+                _cache_result(url, result, etag, last_modified)
+            else:
+                _result_cache.pop(url, None)
             return result
 
         return {
@@ -165,6 +554,9 @@ async def fetch_full_article(
             "hint": "Try calling with force_dynamic=True for JS-rendered pages",
         }
 
+    except FetchError as e:
+        logger.error("%s", e)
+        return {"error": True, "message": str(e), "code": "FETCH_ERROR"}
     except httpx.TimeoutException:
         logger.error("Timeout fetching URL: %s", url)
         return {"error": True, "message": f"Timeout fetching URL: {url}", "code": "TIMEOUT"}
@@ -178,3 +570,41 @@ async def fetch_full_article(
     except httpx.RequestError as e:
         logger.error("Request error fetching URL %s: %s", url, e)
         return {"error": True, "message": f"Request failed: {e}", "code": "REQUEST_ERROR"}
+
+
+async def fetch_full_articles(
+    urls: list[str],
+    timeout: int = 30,
+) -> list[dict[str, Any]]:
+    """Fetch full article content for several URLs concurrently (static fetch).
+
+    Args:
+        urls: The original article URLs to fetch
+        timeout: Request timeout in seconds per URL (default: 30)
+
+    Returns:
+        One result per URL, in input order. Each is either an extracted article
+        (as returned by fetch_full_article) or an error dict.
+    """
+
+    async def fetch_one(url: str) -> dict[str, Any]:
+        async with _fetch_semaphore:
+            return await fetch_full_article(url, timeout=timeout)
+
+    results = await asyncio.gather(*(fetch_one(url) for url in urls), return_exceptions=True)
+
+    articles: list[dict[str, Any]] = []
+    for url, result in zip(urls, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("Fetch failed for %s: %s", url, result)
+            articles.append(
+                {
+                    "error": True,
+                    "message": f"Fetch failed: {result}",
+                    "code": "FETCH_FAILED",
+                    "url": url,
+                }
+            )
+        else:
+            articles.append(result)
+    return articles